@@ -26,7 +26,9 @@ from ._filepath import (
     FilePathValidator,
     is_valid_filepath,
     sanitize_filepath,
+    sanitize_filepaths,
     validate_filepath,
+    validate_filepaths,
 )
 from ._ltsv import sanitize_ltsv_label, validate_ltsv_label
 from ._symbol import replace_symbol, validate_symbol
@@ -66,7 +68,9 @@ __all__ = (
     "FilePathValidator",
     "is_valid_filepath",
     "sanitize_filepath",
+    "sanitize_filepaths",
     "validate_filepath",
+    "validate_filepaths",
     "sanitize_ltsv_label",
     "validate_ltsv_label",
     "replace_symbol",
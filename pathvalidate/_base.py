@@ -7,7 +7,7 @@ import os
 import sys
 from typing import ClassVar, Optional, Sequence, Tuple
 
-from ._common import normalize_platform, unprintable_ascii_chars
+from ._common import get_codec_encoder, normalize_platform, unprintable_ascii_chars
 from ._const import DEFAULT_MIN_LEN, Platform
 from ._types import PathType, PlatformType
 from .error import ReservedNameError, ValidationError
@@ -17,9 +17,11 @@ from .handler import NullValueHandler, ReservedNameHandler, ValidationErrorHandl
 class BaseFile:
     _INVALID_PATH_CHARS: ClassVar[str] = "".join(unprintable_ascii_chars)
     _INVALID_FILENAME_CHARS: ClassVar[str] = _INVALID_PATH_CHARS + "/"
-    _INVALID_WIN_PATH_CHARS: ClassVar[str] = _INVALID_PATH_CHARS + ':*?"<>|\t\n\r\x0b\x0c'
-    _INVALID_WIN_FILENAME_CHARS: ClassVar[str] = (
-        _INVALID_FILENAME_CHARS + _INVALID_WIN_PATH_CHARS + "\\"
+    _INVALID_WIN_PATH_CHARS: ClassVar[str] = "".join(
+        sorted(set(_INVALID_PATH_CHARS + ':*?"<>|\t\n\r\x0b\x0c'))
+    )
+    _INVALID_WIN_FILENAME_CHARS: ClassVar[str] = "".join(
+        sorted(set(_INVALID_FILENAME_CHARS + _INVALID_WIN_PATH_CHARS + "\\"))
     )
 
     @property
@@ -47,6 +49,15 @@ class BaseFile:
         self._additional_reserved_names = tuple(n.upper() for n in additional_reserved_names)
 
         self.__platform = normalize_platform(platform)
+        self._is_universal_platform = self.__platform == Platform.UNIVERSAL
+        self._is_posix_platform = self.__platform == Platform.POSIX
+        self._is_windows_platform = self.__platform == Platform.WINDOWS
+        self._is_linux_platform = self.__platform == Platform.LINUX
+        self._is_macos_platform = self.__platform == Platform.MACOS
+        self._is_win_universal = self._is_universal_platform or self._is_windows_platform
+        self._is_linux_universal = self._is_universal_platform or self._is_linux_platform
+        self._is_macos_universal = self._is_universal_platform or self._is_macos_platform
+        self._path_sep = "\\" if self._is_windows_platform else "/"
 
         if platform_max_len is None:
             platform_max_len = self._get_default_max_path_len()
@@ -62,30 +73,37 @@ class BaseFile:
             self._fs_encoding = fs_encoding
         else:
             self._fs_encoding = sys.getfilesystemencoding()
+        self._fs_codec_encode = get_codec_encoder(self._fs_encoding)
 
     def _is_posix(self) -> bool:
-        return self.platform == Platform.POSIX
+        return self._is_posix_platform
 
     def _is_universal(self) -> bool:
-        return self.platform == Platform.UNIVERSAL
+        return self._is_universal_platform
 
     def _is_linux(self, include_universal: bool = False) -> bool:
         if include_universal:
-            return self.platform in (Platform.UNIVERSAL, Platform.LINUX)
+            return self._is_linux_universal
 
-        return self.platform == Platform.LINUX
+        return self._is_linux_platform
 
     def _is_windows(self, include_universal: bool = False) -> bool:
         if include_universal:
-            return self.platform in (Platform.UNIVERSAL, Platform.WINDOWS)
+            return self._is_win_universal
 
-        return self.platform == Platform.WINDOWS
+        return self._is_windows_platform
 
     def _is_macos(self, include_universal: bool = False) -> bool:
         if include_universal:
-            return self.platform in (Platform.UNIVERSAL, Platform.MACOS)
+            return self._is_macos_universal
+
+        return self._is_macos_platform
+
+    def _encode(self, text: str) -> bytes:
+        if self._fs_codec_encode is None:
+            return text.encode(self._fs_encoding)
 
-        return self.platform == Platform.MACOS
+        return self._fs_codec_encode(text)[0]
 
     def _get_default_max_path_len(self) -> int:
         if self._is_linux():
@@ -120,6 +138,8 @@ class AbstractValidator(BaseFile, metaclass=abc.ABCMeta):
             platform=platform,
         )
 
+        self._reserved_keywords_upper = frozenset(k.upper() for k in self.reserved_keywords)
+
     @abc.abstractproperty
     def min_len(self) -> int:  # pragma: no cover
         pass
@@ -137,7 +157,7 @@ class AbstractValidator(BaseFile, metaclass=abc.ABCMeta):
         return True
 
     def _is_reserved_keyword(self, value: str) -> bool:
-        return value in self.reserved_keywords
+        return value in self._reserved_keywords_upper
 
 
 class AbstractSanitizer(BaseFile, metaclass=abc.ABCMeta):
@@ -212,8 +232,11 @@ class BaseValidator(AbstractValidator):
         if not self._check_reserved:
             return
 
-        root_name = self.__extract_root_name(name)
-        base_name = os.path.basename(name).upper()
+        self._validate_reserved_entry(os.path.basename(name))
+
+    def _validate_reserved_entry(self, base_name: str) -> None:
+        # base_name must not contain path separators
+        root_name = os.path.splitext(base_name)[0]
 
         if self._is_reserved_keyword(root_name.upper()) or self._is_reserved_keyword(
             base_name.upper()
@@ -231,7 +254,3 @@ class BaseValidator(AbstractValidator):
 
         if self.min_len > self.max_len:
             raise ValueError("min_len must be lower than max_len")
-
-    @staticmethod
-    def __extract_root_name(path: str) -> str:
-        return os.path.splitext(os.path.basename(path))[0]
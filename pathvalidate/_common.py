@@ -2,11 +2,14 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import codecs
+import itertools
 import platform
 import re
 import string
+from functools import lru_cache
 from pathlib import PurePath
-from typing import Any, List, Optional
+from typing import Any, Callable, List, Optional, Pattern, Sequence, Tuple
 
 from ._const import Platform
 from ._types import PathType, PlatformType
@@ -39,6 +42,22 @@ def to_str(name: PathType) -> str:
     return name
 
 
+def to_names_key(names: Optional[Sequence[str]]) -> Optional[Tuple[str, ...]]:
+    if names is None:
+        return None
+
+    return tuple(names)
+
+
+def is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+
+    return True
+
+
 def is_null_string(value: Any) -> bool:
     if value is None:
         return True
@@ -56,6 +75,38 @@ def _is_not_null_string(value: Any) -> bool:
         return False
 
 
+def _escape_class_char(c: str) -> str:
+    if c.isprintable():
+        return re.escape(c)
+
+    cp = ord(c)
+    if cp <= 0xFF:
+        return f"\\x{cp:02x}"
+    if cp <= 0xFFFF:
+        return f"\\u{cp:04x}"
+
+    return f"\\U{cp:08x}"
+
+
+def to_char_class(chars: str) -> str:
+    """
+    Make a regular expression character class of the given characters,
+    where runs of consecutive code points are collapsed to ranges (e.g. ``[\\x00-\\x1f]``).
+    """
+
+    items: List[str] = []
+    for _, group in itertools.groupby(
+        enumerate(sorted({ord(c) for c in chars})), key=lambda item: item[1] - item[0]
+    ):
+        run = [chr(cp) for _, cp in group]
+        if len(run) >= 3:
+            items.append(f"{_escape_class_char(run[0])}-{_escape_class_char(run[-1])}")
+        else:
+            items.extend(_escape_class_char(c) for c in run)
+
+    return "[{}]".format("".join(items))
+
+
 def _get_unprintable_ascii_chars() -> List[str]:
     return [chr(c) for c in range(128) if chr(c) not in string.printable]
 
@@ -79,9 +130,7 @@ def _get_ascii_symbols() -> List[str]:
 
 ascii_symbols = tuple(_get_ascii_symbols())
 
-__RE_UNPRINTABLE_CHARS = re.compile(
-    "[{}]".format(re.escape("".join(unprintable_ascii_chars))), re.UNICODE
-)
+__RE_UNPRINTABLE_CHARS = re.compile(to_char_class("".join(unprintable_ascii_chars)), re.UNICODE)
 __RE_ANSI_ESCAPE = re.compile(
     r"(?:\x1B[@-Z\\-_]|[\x80-\x9A\x9C-\x9F]|(?:\x1B\[|\x9B)[0-?]*[ -/]*[@-~])"
 )
@@ -90,8 +139,9 @@ __RE_ANSI_ESCAPE = re.compile(
 def validate_unprintable_char(text: str) -> None:
     from .error import InvalidCharError
 
-    match_list = __RE_UNPRINTABLE_CHARS.findall(to_str(text))
-    if match_list:
+    text = to_str(text)
+    if __RE_UNPRINTABLE_CHARS.search(text) is not None:
+        match_list = __RE_UNPRINTABLE_CHARS.findall(text)
         raise InvalidCharError(f"unprintable character found: {match_list}")
 
 
@@ -109,6 +159,59 @@ def replace_ansi_escape(text: str, replacement_text: str = "") -> str:
         raise TypeError("text must be a string")
 
 
+# str.encode has built-in fast paths for these codecs that are faster than calling the codec
+_BUILTIN_ENCODINGS = frozenset(("utf-8", "ascii", "iso8859-1"))
+
+
+def get_codec_encoder(encoding: str) -> Optional[Callable[[str], Tuple[bytes, int]]]:
+    """
+    Return the encode function of the codec, or |None| if ``str.encode`` should be used:
+    the codec is one of the built-in fast paths or unknown (encoding then raises LookupError).
+    """
+
+    try:
+        codec_info = codecs.lookup(encoding)
+    except LookupError:
+        return None
+
+    if codec_info.name in _BUILTIN_ENCODINGS:
+        return None
+
+    return codec_info.encode
+
+
+def make_ascii_lookup_table(chars: str) -> bytes:
+    # 256-entry bytes.translate table: the given ASCII chars map to 0x01, the others to 0x00
+    return bytes(1 if chr(i) in chars else 0 for i in range(256))
+
+
+@lru_cache(maxsize=32)
+def _make_replacement_table(invalid_bytes: bytes, replacement: bytes) -> bytes:
+    return bytes.maketrans(invalid_bytes, replacement * len(invalid_bytes))
+
+
+def has_invalid_chars(text: str, regexp: Pattern[str], lookup_table: bytes) -> bool:
+    if text.isascii():
+        return 1 in text.encode("ascii").translate(lookup_table)
+
+    return regexp.search(text) is not None
+
+
+def replace_invalid_chars(
+    text: str, replacement_text: str, regexp: Pattern[str], invalid_bytes: bytes
+) -> str:
+    if text.isascii() and replacement_text.isascii() and len(replacement_text) <= 1:
+        # all of the invalid chars are ASCII: bytes.translate is faster than the regex here
+        encoded = text.encode("ascii")
+        if replacement_text:
+            table = _make_replacement_table(invalid_bytes, replacement_text.encode("ascii"))
+            return encoded.translate(table).decode("ascii")
+
+        return encoded.translate(None, invalid_bytes).decode("ascii")
+
+    return regexp.sub(replacement_text, text)
+
+
 def normalize_platform(name: Optional[PlatformType]) -> Platform:
     if isinstance(name, Platform):
         return name
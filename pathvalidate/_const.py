@@ -5,21 +5,23 @@ DEFAULT_MIN_LEN = 1
 INVALID_CHAR_ERR_MSG_TMPL = "invalids=({invalid}), value={value}"
 
 
-_NTFS_RESERVED_FILE_NAMES = (
-    "$Mft",
-    "$MftMirr",
-    "$LogFile",
-    "$Volume",
-    "$AttrDef",
-    "$Bitmap",
-    "$Boot",
-    "$BadClus",
-    "$Secure",
-    "$Upcase",
-    "$Extend",
-    "$Quota",
-    "$ObjId",
-    "$Reparse",
+_NTFS_RESERVED_FILE_NAMES = frozenset(
+    (
+        "$Mft",
+        "$MftMirr",
+        "$LogFile",
+        "$Volume",
+        "$AttrDef",
+        "$Bitmap",
+        "$Boot",
+        "$BadClus",
+        "$Secure",
+        "$Upcase",
+        "$Extend",
+        "$Quota",
+        "$ObjId",
+        "$Reparse",
+    )
 )  # Only in root directory
 
 
@@ -7,11 +7,23 @@ import ntpath
 import posixpath
 import re
 import warnings
+from functools import lru_cache
 from pathlib import Path, PurePath
-from typing import Optional, Pattern, Sequence, Tuple
+from typing import Iterable, List, Optional, Pattern, Sequence, Tuple
 
 from ._base import AbstractSanitizer, AbstractValidator, BaseFile, BaseValidator
-from ._common import findall_to_str, to_str, validate_pathtype
+from ._common import (
+    findall_to_str,
+    has_invalid_chars,
+    is_hashable,
+    make_ascii_lookup_table,
+    normalize_platform,
+    replace_invalid_chars,
+    to_char_class,
+    to_names_key,
+    to_str,
+    validate_pathtype,
+)
 from ._const import DEFAULT_MIN_LEN, INVALID_CHAR_ERR_MSG_TMPL, Platform
 from ._types import PathType, PlatformType
 from .error import ErrorAttrKey, ErrorReason, InvalidCharError, ValidationError
@@ -19,10 +31,14 @@ from .handler import ReservedNameHandler, ValidationErrorHandler
 
 
 _DEFAULT_MAX_FILENAME_LEN = 255
-_RE_INVALID_FILENAME = re.compile(f"[{re.escape(BaseFile._INVALID_FILENAME_CHARS):s}]", re.UNICODE)
+_RE_INVALID_FILENAME = re.compile(to_char_class(BaseFile._INVALID_FILENAME_CHARS), re.UNICODE)
 _RE_INVALID_WIN_FILENAME = re.compile(
-    f"[{re.escape(BaseFile._INVALID_WIN_FILENAME_CHARS):s}]", re.UNICODE
+    to_char_class(BaseFile._INVALID_WIN_FILENAME_CHARS), re.UNICODE
 )
+_INVALID_FILENAME_BYTES = BaseFile._INVALID_FILENAME_CHARS.encode("ascii")
+_INVALID_WIN_FILENAME_BYTES = BaseFile._INVALID_WIN_FILENAME_CHARS.encode("ascii")
+_INVALID_FILENAME_LUT = make_ascii_lookup_table(BaseFile._INVALID_FILENAME_CHARS)
+_INVALID_WIN_FILENAME_LUT = make_ascii_lookup_table(BaseFile._INVALID_WIN_FILENAME_CHARS)
 
 
 class FileNameSanitizer(AbstractSanitizer):
@@ -62,19 +78,84 @@ class FileNameSanitizer(AbstractSanitizer):
         )
 
         self._sanitize_regexp = self._get_sanitize_regexp()
+        self._invalid_bytes = (
+            _INVALID_WIN_FILENAME_BYTES if self._is_win_universal else _INVALID_FILENAME_BYTES
+        )
+        self._allow_whitespaces = not self._is_win_universal
 
     def sanitize(self, value: PathType, replacement_text: str = "") -> PathType:
-        try:
-            validate_pathtype(value, allow_whitespaces=not self._is_windows(include_universal=True))
-        except ValidationError as e:
-            if e.reason == ErrorReason.NULL_NAME:
-                if isinstance(value, PurePath):
+        if isinstance(value, str) and value.strip():
+            unicode_filename = value
+        else:
+            try:
+                validate_pathtype(value, allow_whitespaces=self._allow_whitespaces)
+            except ValidationError as e:
+                if e.reason == ErrorReason.NULL_NAME:
+                    if isinstance(value, PurePath):
+                        raise
+
+                    return self._null_value_handler(e)
+                raise
+
+            unicode_filename = str(value)
+
+        sanitized_filename = replace_invalid_chars(
+            unicode_filename, replacement_text, self._sanitize_regexp, self._invalid_bytes
+        )
+        sanitized_filename = self.__sanitize_substituted(sanitized_filename)
+
+        if isinstance(value, PurePath):
+            return Path(sanitized_filename)
+
+        return sanitized_filename
+
+    def sanitize_components(self, entries: Iterable[str], replacement_text: str = "") -> List[str]:
+        """
+        Sanitize multiple file names at once, e.g. the components of a path.
+        The result is the same as calling :py:meth:`sanitize` for each of the entries.
+
+        Args:
+            entries:
+                File names to sanitize.
+            replacement_text:
+                Replacement text for invalid characters.
+
+        Returns:
+            List of the sanitized file names, in the same order as ``entries``.
+        """
+
+        regexp = self._sanitize_regexp
+        invalid_bytes = self._invalid_bytes
+        return self._sanitize_substituted_components(
+            [
+                replace_invalid_chars(entry, replacement_text, regexp, invalid_bytes)
+                for entry in entries
+            ]
+        )
+
+    def _sanitize_substituted_components(self, entries: Iterable[str]) -> List[str]:
+        """Sanitize file names whose invalid characters are already replaced."""
+
+        allow_whitespaces = self._allow_whitespaces
+        sanitize_substituted = self.__sanitize_substituted
+        sanitized_entries: List[str] = []
+        append_entry = sanitized_entries.append
+
+        for entry in entries:
+            if not entry.strip():
+                try:
+                    validate_pathtype(entry, allow_whitespaces=allow_whitespaces)
+                except ValidationError as e:
+                    if e.reason == ErrorReason.NULL_NAME:
+                        append_entry(self._null_value_handler(e))
+                        continue
                     raise
 
-                return self._null_value_handler(e)
-            raise
+            append_entry(sanitize_substituted(entry))
+
+        return sanitized_entries
 
-        sanitized_filename = self._sanitize_regexp.sub(replacement_text, str(value))
+    def __sanitize_substituted(self, sanitized_filename: str) -> str:
         sanitized_filename = sanitized_filename[: self.max_len]
 
         try:
@@ -86,9 +167,7 @@ class FileNameSanitizer(AbstractSanitizer):
                     sanitized_filename = re.sub(
                         re.escape(e.reserved_name), replacement_word, sanitized_filename
                     )
-            elif e.reason == ErrorReason.INVALID_CHARACTER and self._is_windows(
-                include_universal=True
-            ):
+            elif e.reason == ErrorReason.INVALID_CHARACTER and self._is_win_universal:
                 # Do not start a file or directory name with a space
                 sanitized_filename = sanitized_filename.lstrip(" ")
 
@@ -109,13 +188,10 @@ class FileNameSanitizer(AbstractSanitizer):
                     platform=self.platform,
                 )
 
-        if isinstance(value, PurePath):
-            return Path(sanitized_filename)
-
         return sanitized_filename
 
     def _get_sanitize_regexp(self) -> Pattern[str]:
-        if self._is_windows(include_universal=True):
+        if self._is_win_universal:
             return _RE_INVALID_WIN_FILENAME
 
         return _RE_INVALID_FILENAME
@@ -127,19 +203,27 @@ class FileNameValidator(BaseValidator):
     )
     _MACOS_RESERVED_FILE_NAMES = (":",)
 
+    __reserved_keywords: Optional[Tuple[str, ...]]
+
     @property
     def reserved_keywords(self) -> Tuple[str, ...]:
+        if self.__reserved_keywords is None:
+            self.__reserved_keywords = self._compute_reserved_keywords()
+
+        return self.__reserved_keywords
+
+    def _compute_reserved_keywords(self) -> Tuple[str, ...]:
         common_keywords = super().reserved_keywords
 
-        if self._is_universal():
+        if self._is_universal_platform:
             word_set = set(
                 common_keywords
                 + self._WINDOWS_RESERVED_FILE_NAMES
                 + self._MACOS_RESERVED_FILE_NAMES
             )
-        elif self._is_windows():
+        elif self._is_windows_platform:
             word_set = set(common_keywords + self._WINDOWS_RESERVED_FILE_NAMES)
-        elif self._is_posix() or self._is_macos():
+        elif self._is_posix_platform or self._is_macos_platform:
             word_set = set(common_keywords + self._MACOS_RESERVED_FILE_NAMES)
         else:
             word_set = set(common_keywords)
@@ -155,6 +239,8 @@ class FileNameValidator(BaseValidator):
         check_reserved: bool = True,
         additional_reserved_names: Optional[Sequence[str]] = None,
     ) -> None:
+        self.__reserved_keywords = None
+
         super().__init__(
             min_len=min_len,
             max_len=max_len,
@@ -165,11 +251,16 @@ class FileNameValidator(BaseValidator):
             platform=platform,
         )
 
+        self._allow_whitespaces = not self._is_win_universal
+
     def validate(self, value: PathType) -> None:
-        validate_pathtype(value, allow_whitespaces=not self._is_windows(include_universal=True))
+        if isinstance(value, str) and value.strip():
+            unicode_filename = value
+        else:
+            validate_pathtype(value, allow_whitespaces=self._allow_whitespaces)
+            unicode_filename = to_str(value)
 
-        unicode_filename = to_str(value)
-        byte_ct = len(unicode_filename.encode(self._fs_encoding))
+        byte_ct = len(self._encode(unicode_filename))
 
         self.validate_abspath(unicode_filename)
 
@@ -197,26 +288,20 @@ class FileNameValidator(BaseValidator):
         self._validate_reserved_keywords(unicode_filename)
         self.__validate_universal_filename(unicode_filename)
 
-        if self._is_windows(include_universal=True):
+        if self._is_win_universal:
             self.__validate_win_filename(unicode_filename)
 
     def validate_abspath(self, value: str) -> None:
-        err = ValidationError(
-            description=f"found an absolute path ({value}), expected a filename",
-            platform=self.platform,
-            reason=ErrorReason.FOUND_ABS_PATH,
-        )
-
-        if self._is_windows(include_universal=True):
-            if ntpath.isabs(value):
-                raise err
-
-        if posixpath.isabs(value):
-            raise err
+        if posixpath.isabs(value) or (self._is_win_universal and ntpath.isabs(value)):
+            raise ValidationError(
+                description=f"found an absolute path ({value}), expected a filename",
+                platform=self.platform,
+                reason=ErrorReason.FOUND_ABS_PATH,
+            )
 
     def __validate_universal_filename(self, unicode_filename: str) -> None:
-        match = _RE_INVALID_FILENAME.findall(unicode_filename)
-        if match:
+        if has_invalid_chars(unicode_filename, _RE_INVALID_FILENAME, _INVALID_FILENAME_LUT):
+            match = _RE_INVALID_FILENAME.findall(unicode_filename)
             raise InvalidCharError(
                 INVALID_CHAR_ERR_MSG_TMPL.format(
                     invalid=findall_to_str(match), value=repr(unicode_filename)
@@ -225,8 +310,8 @@ class FileNameValidator(BaseValidator):
             )
 
     def __validate_win_filename(self, unicode_filename: str) -> None:
-        match = _RE_INVALID_WIN_FILENAME.findall(unicode_filename)
-        if match:
+        if has_invalid_chars(unicode_filename, _RE_INVALID_WIN_FILENAME, _INVALID_WIN_FILENAME_LUT):
+            match = _RE_INVALID_WIN_FILENAME.findall(unicode_filename)
             raise InvalidCharError(
                 INVALID_CHAR_ERR_MSG_TMPL.format(
                     invalid=findall_to_str(match), value=repr(unicode_filename)
@@ -262,6 +347,73 @@ class FileNameValidator(BaseValidator):
             )
 
 
+@lru_cache(maxsize=64)
+def _get_filename_validator(
+    platform: Platform,
+    min_len: int,
+    max_len: int,
+    fs_encoding: Optional[str],
+    check_reserved: bool,
+    additional_reserved_names: Optional[Tuple[str, ...]],
+) -> FileNameValidator:
+    return FileNameValidator(
+        platform=platform,
+        min_len=min_len,
+        max_len=max_len,
+        fs_encoding=fs_encoding,
+        check_reserved=check_reserved,
+        additional_reserved_names=additional_reserved_names,
+    )
+
+
+def _make_filename_sanitizer(
+    platform: Platform,
+    max_len: int,
+    fs_encoding: Optional[str],
+    null_value_handler: Optional[ValidationErrorHandler],
+    reserved_name_handler: Optional[ValidationErrorHandler],
+    additional_reserved_names: Optional[Tuple[str, ...]],
+    validate_after_sanitize: bool,
+) -> FileNameSanitizer:
+    return FileNameSanitizer(
+        platform=platform,
+        max_len=max_len,
+        fs_encoding=fs_encoding,
+        null_value_handler=null_value_handler,
+        reserved_name_handler=reserved_name_handler,
+        additional_reserved_names=additional_reserved_names,
+        validate_after_sanitize=validate_after_sanitize,
+    )
+
+
+_get_cached_filename_sanitizer = lru_cache(maxsize=64)(_make_filename_sanitizer)
+
+
+def _get_filename_sanitizer(
+    platform: Platform,
+    max_len: int,
+    fs_encoding: Optional[str],
+    null_value_handler: Optional[ValidationErrorHandler],
+    reserved_name_handler: Optional[ValidationErrorHandler],
+    additional_reserved_names: Optional[Tuple[str, ...]],
+    validate_after_sanitize: bool,
+) -> FileNameSanitizer:
+    args = (
+        platform,
+        max_len,
+        fs_encoding,
+        null_value_handler,
+        reserved_name_handler,
+        additional_reserved_names,
+        validate_after_sanitize,
+    )
+    if is_hashable(null_value_handler) and is_hashable(reserved_name_handler):
+        return _get_cached_filename_sanitizer(*args)
+
+    # an unhashable handler (e.g. a dataclass instance with __call__) cannot be a cache key
+    return _make_filename_sanitizer(*args)
+
+
 def validate_filename(
     filename: PathType,
     platform: Optional[PlatformType] = None,
@@ -322,13 +474,13 @@ def validate_filename(
         <https://docs.microsoft.com/en-us/windows/win32/fileio/naming-a-file>`__
     """
 
-    FileNameValidator(
-        platform=platform,
-        min_len=min_len,
-        max_len=max_len,
-        fs_encoding=fs_encoding,
-        check_reserved=check_reserved,
-        additional_reserved_names=additional_reserved_names,
+    _get_filename_validator(
+        normalize_platform(platform),
+        min_len,
+        max_len,
+        fs_encoding,
+        check_reserved,
+        to_names_key(additional_reserved_names),
     ).validate(filename)
 
 
@@ -356,13 +508,13 @@ def is_valid_filename(
         :py:func:`.validate_filename()`
     """
 
-    return FileNameValidator(
-        platform=platform,
-        min_len=min_len,
-        max_len=-1 if max_len is None else max_len,
-        fs_encoding=fs_encoding,
-        check_reserved=check_reserved,
-        additional_reserved_names=additional_reserved_names,
+    return _get_filename_validator(
+        normalize_platform(platform),
+        min_len,
+        -1 if max_len is None else max_len,
+        fs_encoding,
+        check_reserved,
+        to_names_key(additional_reserved_names),
     ).is_valid(filename)
 
 
@@ -455,12 +607,12 @@ def sanitize_filename(
         if check_reserved is False:
             reserved_name_handler = ReservedNameHandler.as_is
 
-    return FileNameSanitizer(
-        platform=platform,
-        max_len=-1 if max_len is None else max_len,
-        fs_encoding=fs_encoding,
-        null_value_handler=null_value_handler,
-        reserved_name_handler=reserved_name_handler,
-        additional_reserved_names=additional_reserved_names,
-        validate_after_sanitize=validate_after_sanitize,
+    return _get_filename_sanitizer(
+        normalize_platform(platform),
+        -1 if max_len is None else max_len,
+        fs_encoding,
+        null_value_handler,
+        reserved_name_handler,
+        to_names_key(additional_reserved_names),
+        validate_after_sanitize,
     ).sanitize(filename, replacement_text)
@@ -2,16 +2,28 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import codecs
 import ntpath
 import os.path
 import posixpath
 import re
 import warnings
+from functools import lru_cache
 from pathlib import Path, PurePath
-from typing import List, Optional, Pattern, Sequence, Tuple
+from typing import Iterable, Iterator, List, Optional, Pattern, Sequence, Tuple, Union
 
 from ._base import AbstractSanitizer, AbstractValidator, BaseFile, BaseValidator
-from ._common import findall_to_str, to_str, validate_pathtype
+from ._common import (
+    findall_to_str,
+    is_hashable,
+    make_ascii_lookup_table,
+    normalize_platform,
+    replace_invalid_chars,
+    to_char_class,
+    to_names_key,
+    to_str,
+    validate_pathtype,
+)
 from ._const import _NTFS_RESERVED_FILE_NAMES, DEFAULT_MIN_LEN, INVALID_CHAR_ERR_MSG_TMPL, Platform
 from ._filename import FileNameSanitizer, FileNameValidator
 from ._types import PathType, PlatformType
@@ -19,8 +31,81 @@ from .error import ErrorAttrKey, ErrorReason, InvalidCharError, ReservedNameErro
 from .handler import ReservedNameHandler, ValidationErrorHandler
 
 
-_RE_INVALID_PATH = re.compile(f"[{re.escape(BaseFile._INVALID_PATH_CHARS):s}]", re.UNICODE)
-_RE_INVALID_WIN_PATH = re.compile(f"[{re.escape(BaseFile._INVALID_WIN_PATH_CHARS):s}]", re.UNICODE)
+_RE_INVALID_PATH = re.compile(to_char_class(BaseFile._INVALID_PATH_CHARS), re.UNICODE)
+_RE_INVALID_WIN_PATH = re.compile(to_char_class(BaseFile._INVALID_WIN_PATH_CHARS), re.UNICODE)
+_RE_PATH_SEPARATOR = re.compile(r"[\\/]")
+_INVALID_PATH_BYTES = BaseFile._INVALID_PATH_CHARS.encode("ascii")
+_INVALID_WIN_PATH_BYTES = BaseFile._INVALID_WIN_PATH_CHARS.encode("ascii")
+_NTFS_RESERVED_SET = frozenset(name.upper() for name in _NTFS_RESERVED_FILE_NAMES)
+
+
+_INVALID_PATH_LUT = make_ascii_lookup_table(BaseFile._INVALID_PATH_CHARS)
+_INVALID_WIN_PATH_LUT = make_ascii_lookup_table(BaseFile._INVALID_WIN_PATH_CHARS)
+_ASCII_BYTES = bytes(range(128))
+
+
+def _is_ascii_compatible(encoding: str) -> bool:
+    try:
+        return _ASCII_BYTES.decode("ascii").encode(encoding) == _ASCII_BYTES
+    except (LookupError, UnicodeError):
+        return False
+
+
+def _is_utf8(encoding: str) -> bool:
+    try:
+        return codecs.lookup(encoding).name == "utf-8"
+    except LookupError:
+        return False
+
+
+def _split_path(path: str) -> List[str]:
+    if "\\" in path:
+        return _RE_PATH_SEPARATOR.split(path)
+
+    return path.split("/")
+
+
+def _needs_normalization(path: str) -> bool:
+    if os.altsep and os.altsep in path:
+        # os.path.normpath converts alternative separators to os.sep
+        return True
+
+    sep = os.sep
+    return (
+        sep + sep in path
+        or f"{sep}.{sep}" in path
+        or f"{sep}..{sep}" in path
+        or path.startswith((f".{sep}", f"..{sep}"))
+        or path.endswith((f"{sep}.", f"{sep}.."))
+        or (len(path) > 1 and path.endswith(sep))
+    )
+
+
+def _normalize_posix_entries(entries: List[str]) -> List[str]:
+    """
+    Normalize the entries of a path split by "/" as posixpath.normpath does,
+    without joining them back into a string that would be split again.
+    """
+
+    is_abs = not entries[0]
+    normalized_entries: List[str] = []
+    for entry in entries:
+        if not entry or entry == ".":
+            continue
+
+        if (
+            entry != ".."
+            or (not is_abs and not normalized_entries)
+            or (normalized_entries and normalized_entries[-1] == "..")
+        ):
+            normalized_entries.append(entry)
+        elif normalized_entries:
+            normalized_entries.pop()
+
+    if is_abs:
+        return [""] + normalized_entries
+
+    return normalized_entries or ["."]
 
 
 class FilePathSanitizer(AbstractSanitizer):
@@ -59,6 +144,9 @@ class FilePathSanitizer(AbstractSanitizer):
         )
 
         self._sanitize_regexp = self._get_sanitize_regexp()
+        self._invalid_bytes = (
+            _INVALID_WIN_PATH_BYTES if self._is_win_universal else _INVALID_PATH_BYTES
+        )
         self.__fname_sanitizer = FileNameSanitizer(
             max_len=self.max_len,
             fs_encoding=fs_encoding,
@@ -69,50 +157,38 @@ class FilePathSanitizer(AbstractSanitizer):
             validate_after_sanitize=validate_after_sanitize,
         )
         self.__normalize = normalize
+        self._allow_whitespaces = not self._is_win_universal
 
-        if self._is_windows(include_universal=True):
+        if self._is_win_universal:
             self.__split_drive = ntpath.splitdrive
         else:
             self.__split_drive = posixpath.splitdrive
 
     def sanitize(self, value: PathType, replacement_text: str = "") -> PathType:
-        try:
-            validate_pathtype(value, allow_whitespaces=not self._is_windows(include_universal=True))
-        except ValidationError as e:
-            if e.reason == ErrorReason.NULL_NAME:
-                if isinstance(value, PurePath):
-                    raise
+        if isinstance(value, str) and value.strip():
+            unicode_filepath = value
+        else:
+            try:
+                validate_pathtype(value, allow_whitespaces=self._allow_whitespaces)
+            except ValidationError as e:
+                if e.reason == ErrorReason.NULL_NAME:
+                    if isinstance(value, PurePath):
+                        raise
 
-                return self._null_value_handler(e)
-            raise
+                    return self._null_value_handler(e)
+                raise
 
-        unicode_filepath = to_str(value)
+            unicode_filepath = to_str(value)
 
         drive, unicode_filepath = self.__split_drive(unicode_filepath)
-        unicode_filepath = self._sanitize_regexp.sub(replacement_text, unicode_filepath)
-        if self.__normalize and unicode_filepath:
-            unicode_filepath = os.path.normpath(unicode_filepath)
-        sanitized_path = unicode_filepath
-
-        sanitized_entries: List[str] = []
-        if drive:
-            sanitized_entries.append(drive)
-        for entry in sanitized_path.replace("\\", "/").split("/"):
-            if entry in _NTFS_RESERVED_FILE_NAMES:
-                sanitized_entries.append(f"{entry}_")
-                continue
-
-            sanitized_entry = str(
-                self.__fname_sanitizer.sanitize(entry, replacement_text=replacement_text)
-            )
-            if not sanitized_entry:
-                if not sanitized_entries:
-                    sanitized_entries.append("")
-                continue
-
-            sanitized_entries.append(sanitized_entry)
+        if drive[:1] in ("/", "\\"):
+            # a UNC drive: e.g. "//server/share" -> "\\\\server\\share"
+            drive = drive.replace("/", "\\").replace("\\", self._path_sep)
+        if self.__is_sanitized(unicode_filepath):
+            sanitized_path = drive + unicode_filepath
+        else:
+            sanitized_path = self.__sanitize_path(drive, unicode_filepath, replacement_text)
 
-        sanitized_path = self.__get_path_separator().join(sanitized_entries)
         try:
             self._validator.validate(sanitized_path)
         except ValidationError as e:
@@ -127,34 +203,108 @@ class FilePathSanitizer(AbstractSanitizer):
 
         return sanitized_path
 
+    def __sanitize_path(self, drive: str, unicode_filepath: str, replacement_text: str) -> str:
+        unicode_filepath = replace_invalid_chars(
+            unicode_filepath, replacement_text, self._sanitize_regexp, self._invalid_bytes
+        )
+        if self.__normalize and unicode_filepath and _needs_normalization(unicode_filepath):
+            if os.sep == "/" and "\\" not in unicode_filepath:
+                entries = _normalize_posix_entries(unicode_filepath.split("/"))
+            else:
+                entries = _split_path(os.path.normpath(unicode_filepath))
+        else:
+            entries = _split_path(unicode_filepath)
+        sanitized_entries: List[str] = []
+        append_entry = sanitized_entries.append
+        if len(entries) > 1 and not entries[0]:
+            # the root of an absolute path is not a file name: keep it out of the null handler
+            append_entry("")
+            entries = entries[1:]
+        for entry, sanitized_entry in zip(
+            entries, self.__fname_sanitizer._sanitize_substituted_components(entries)
+        ):
+            if entry.upper() in _NTFS_RESERVED_SET:
+                append_entry(f"{entry}_")
+                continue
+
+            if not sanitized_entry:
+                if not sanitized_entries:
+                    append_entry("")
+                continue
+
+            append_entry(sanitized_entry)
+
+        if not drive:
+            return self._path_sep.join(sanitized_entries)
+
+        if (
+            sanitized_entries == [""]
+            and unicode_filepath.startswith(("/", "\\"))
+            and not drive.startswith(self._path_sep)
+        ):
+            # keep the root of a drive letter: e.g. "C:\\" (a UNC share is already a root)
+            return drive + self._path_sep
+
+        # a drive relative path stays relative: e.g. "C:foo"
+        return drive + self._path_sep.join(sanitized_entries)
+
+    def __is_sanitized(self, unicode_filepath: str) -> bool:
+        """
+        Return True if sanitizing the path would not change it:
+        no invalid characters, nothing to normalize or re-join, and valid entries only.
+        """
+
+        sep = self._path_sep
+        if (
+            not unicode_filepath
+            or self._sanitize_regexp.search(unicode_filepath) is not None
+            or ("/" if sep == "\\" else "\\") in unicode_filepath
+            or sep + sep in unicode_filepath
+            or unicode_filepath.endswith(sep)
+            or (self.__normalize and _needs_normalization(unicode_filepath))
+        ):
+            return False
+
+        is_valid_entry = self.__fname_sanitizer._validator.is_valid
+        entries = unicode_filepath.split(sep)
+        if not entries[0]:
+            del entries[0]
+        try:
+            for entry in entries:
+                if entry.upper() in _NTFS_RESERVED_SET or not is_valid_entry(entry):
+                    return False
+        except UnicodeError:
+            # an entry not encodable with fs_encoding: leave it to the truncating sanitization
+            return False
+
+        return True
+
     def _get_sanitize_regexp(self) -> Pattern[str]:
-        if self._is_windows(include_universal=True):
+        if self._is_win_universal:
             return _RE_INVALID_WIN_PATH
 
         return _RE_INVALID_PATH
 
-    def __get_path_separator(self) -> str:
-        if self._is_windows():
-            return "\\"
-
-        return "/"
-
 
 class FilePathValidator(BaseValidator):
-    _RE_NTFS_RESERVED = re.compile(
-        "|".join(f"^/{re.escape(pattern)}$" for pattern in _NTFS_RESERVED_FILE_NAMES),
-        re.IGNORECASE,
-    )
     _MACOS_RESERVED_FILE_PATHS = ("/", ":")
 
+    __reserved_keywords: Optional[Tuple[str, ...]]
+
     @property
     def reserved_keywords(self) -> Tuple[str, ...]:
+        if self.__reserved_keywords is None:
+            self.__reserved_keywords = self._compute_reserved_keywords()
+
+        return self.__reserved_keywords
+
+    def _compute_reserved_keywords(self) -> Tuple[str, ...]:
         common_keywords = super().reserved_keywords
 
-        if any([self._is_universal(), self._is_posix(), self._is_macos()]):
+        if self._is_universal_platform or self._is_posix_platform or self._is_macos_platform:
             return common_keywords + self._MACOS_RESERVED_FILE_PATHS
 
-        if self._is_linux():
+        if self._is_linux_platform:
             return common_keywords + ("/",)
 
         return common_keywords
@@ -168,6 +318,8 @@ class FilePathValidator(BaseValidator):
         check_reserved: bool = True,
         additional_reserved_names: Optional[Sequence[str]] = None,
     ) -> None:
+        self.__reserved_keywords = None
+
         super().__init__(
             min_len=min_len,
             max_len=max_len,
@@ -184,22 +336,32 @@ class FilePathValidator(BaseValidator):
             additional_reserved_names=additional_reserved_names,
             platform=platform,
         )
+        self.__fname_reserved_names = self.__fname_validator._reserved_keywords_upper
 
-        if self._is_windows(include_universal=True):
-            self.__split_drive = ntpath.splitdrive
+        self._allow_whitespaces = not self._is_win_universal
+        self._is_ascii_compatible_fs_encoding = _is_ascii_compatible(self._fs_encoding)
+        self._is_utf8_fs_encoding = _is_utf8(self._fs_encoding)
+
+        if self._is_win_universal:
+            self._validate_regexp = _RE_INVALID_WIN_PATH
+            self._invalid_chars_lut = _INVALID_WIN_PATH_LUT
         else:
-            self.__split_drive = posixpath.splitdrive
+            self._validate_regexp = _RE_INVALID_PATH
+            self._invalid_chars_lut = _INVALID_PATH_LUT
 
     def validate(self, value: PathType) -> None:
-        validate_pathtype(value, allow_whitespaces=not self._is_windows(include_universal=True))
-        self.validate_abspath(value)
+        if isinstance(value, str) and value.strip():
+            unicode_filepath = value
+        else:
+            validate_pathtype(value, allow_whitespaces=self._allow_whitespaces)
+            unicode_filepath = to_str(value)
 
-        _drive, tail = self.__split_drive(value)
-        if not tail:
+        _drive, unicode_filepath = self._split_and_validate_abspath(unicode_filepath)
+        if not unicode_filepath:
             return
 
-        unicode_filepath = to_str(tail)
-        byte_ct = len(unicode_filepath.encode(self._fs_encoding))
+        encoded_filepath = self._encode(unicode_filepath)
+        byte_ct = len(encoded_filepath)
         err_kwargs = {
             ErrorAttrKey.REASON: ErrorReason.INVALID_LENGTH,
             ErrorAttrKey.PLATFORM: self.platform,
@@ -224,39 +386,54 @@ class FilePathValidator(BaseValidator):
                 **err_kwargs,
             )
 
-        self._validate_reserved_keywords(unicode_filepath)
-        unicode_filepath = unicode_filepath.replace("\\", "/")
-        for entry in unicode_filepath.split("/"):
+        if self._check_reserved:
+            self._validate_reserved_keywords(unicode_filepath)
+            # e.g. Linux has no reserved file names unless additional names are given
+            if self.__fname_reserved_names:
+                self.__validate_reserved_entries(unicode_filepath)
+
+        if self._is_win_universal:
+            self.__validate_win_filepath(unicode_filepath, encoded_filepath)
+        else:
+            self.__validate_unix_filepath(unicode_filepath, encoded_filepath)
+
+    def __validate_reserved_entries(self, unicode_filepath: str) -> None:
+        reserved_names = self.__fname_reserved_names
+        for entry in _split_path(unicode_filepath):
             if not entry or entry in (".", ".."):
                 continue
 
-            self.__fname_validator._validate_reserved_keywords(entry)
-
-        if self._is_windows(include_universal=True):
-            self.__validate_win_filepath(unicode_filepath)
-        else:
-            self.__validate_unix_filepath(unicode_filepath)
+            upper_entry = entry.upper()
+            if upper_entry in reserved_names or upper_entry.rpartition(".")[0] in reserved_names:
+                # the file name validator applies the exact root name semantics
+                self.__fname_validator._validate_reserved_entry(entry)
 
     def validate_abspath(self, value: PathType) -> None:
-        is_posix_abs = posixpath.isabs(value)
+        self._split_and_validate_abspath(to_str(value))
+
+    def _split_and_validate_abspath(self, value: str) -> Tuple[str, str]:
+        head = value[:2]
+        if not head or (head[0] not in "/\\" and head[1:] != ":"):
+            # neither an absolute path of any style nor a path with a drive
+            return "", value
+
+        is_posix_abs = head[0] == "/"
+        if self._is_linux_platform and is_posix_abs:
+            return "", value
+
         is_nt_abs = ntpath.isabs(value)
-        err_object = ValidationError(
-            description=(
-                "an invalid absolute file path ({}) for the platform ({}).".format(
-                    value, self.platform.value
-                )
-                + " to avoid the error, specify an appropriate platform corresponding to"
-                + " the path format or 'auto'."
-            ),
-            platform=self.platform,
-            reason=ErrorReason.MALFORMED_ABS_PATH,
-        )
+        nt_drive, nt_tail = ntpath.splitdrive(value)
+        if self._is_win_universal:
+            drive, tail = nt_drive, nt_tail
+        else:
+            # posixpath.splitdrive never finds a drive
+            drive, tail = "", value
 
-        if any([self._is_windows() and is_nt_abs, self._is_linux() and is_posix_abs]):
-            return
+        if (self._is_windows_platform and is_nt_abs) or (self._is_linux_platform and is_posix_abs):
+            return drive, tail
 
-        if self._is_universal() and any([is_posix_abs, is_nt_abs]):
-            ValidationError(
+        if self._is_universal_platform and (is_posix_abs or is_nt_abs):
+            raise ValidationError(
                 description=(
                     ("POSIX style" if is_posix_abs else "NT style")
                     + " absolute file path found. expected a platform-independent file path."
@@ -265,25 +442,49 @@ class FilePathValidator(BaseValidator):
                 reason=ErrorReason.MALFORMED_ABS_PATH,
             )
 
-        if self._is_windows(include_universal=True) and is_posix_abs:
-            raise err_object
+        if (self._is_windows_platform and is_posix_abs) or (
+            not self._is_windows_platform and nt_drive and is_nt_abs
+        ):
+            raise ValidationError(
+                description=(
+                    "an invalid absolute file path ({}) for the platform ({}).".format(
+                        value, self.platform.value
+                    )
+                    + " to avoid the error, specify an appropriate platform corresponding to"
+                    + " the path format or 'auto'."
+                ),
+                platform=self.platform,
+                reason=ErrorReason.MALFORMED_ABS_PATH,
+            )
+
+        return drive, tail
+
+    def __has_invalid_chars(self, unicode_filepath: str, encoded_filepath: bytes) -> bool:
+        # all of the invalid chars are ASCII and UTF-8 never uses ASCII bytes within
+        # a multi-byte sequence: the encoded bytes can be scanned even for non-ASCII paths
+        if not self._is_utf8_fs_encoding:
+            if not unicode_filepath.isascii():
+                return self._validate_regexp.search(unicode_filepath) is not None
+
+            # reuse the bytes from the length check when they are identical to the ASCII bytes
+            if not self._is_ascii_compatible_fs_encoding:
+                encoded_filepath = unicode_filepath.encode("ascii")
 
-        drive, _tail = ntpath.splitdrive(value)
-        if not self._is_windows() and drive and is_nt_abs:
-            raise err_object
+        # map each byte through a 256-entry table: invalid chars become 0x01
+        return 1 in encoded_filepath.translate(self._invalid_chars_lut)
 
-    def __validate_unix_filepath(self, unicode_filepath: str) -> None:
-        match = _RE_INVALID_PATH.findall(unicode_filepath)
-        if match:
+    def __validate_unix_filepath(self, unicode_filepath: str, encoded_filepath: bytes) -> None:
+        if self.__has_invalid_chars(unicode_filepath, encoded_filepath):
+            match = self._validate_regexp.findall(unicode_filepath)
             raise InvalidCharError(
                 INVALID_CHAR_ERR_MSG_TMPL.format(
                     invalid=findall_to_str(match), value=repr(unicode_filepath)
                 )
             )
 
-    def __validate_win_filepath(self, unicode_filepath: str) -> None:
-        match = _RE_INVALID_WIN_PATH.findall(unicode_filepath)
-        if match:
+    def __validate_win_filepath(self, unicode_filepath: str, encoded_filepath: bytes) -> None:
+        if self.__has_invalid_chars(unicode_filepath, encoded_filepath):
+            match = self._validate_regexp.findall(unicode_filepath)
             raise InvalidCharError(
                 INVALID_CHAR_ERR_MSG_TMPL.format(
                     invalid=findall_to_str(match), value=repr(unicode_filepath)
@@ -291,17 +492,86 @@ class FilePathValidator(BaseValidator):
                 platform=Platform.WINDOWS,
             )
 
-        _drive, value = self.__split_drive(unicode_filepath)
-        if value:
-            match_reserved = self._RE_NTFS_RESERVED.search(value)
-            if match_reserved:
-                reserved_name = match_reserved.group()
-                raise ReservedNameError(
-                    f"'{reserved_name}' is a reserved name",
-                    reusable_name=False,
-                    reserved_name=reserved_name,
-                    platform=self.platform,
-                )
+        # the drive is already split off by validate().
+        # NTFS metadata file names are only reserved in the root directory
+        if unicode_filepath[0] in "/\\" and unicode_filepath[1:].upper() in _NTFS_RESERVED_SET:
+            raise ReservedNameError(
+                f"'{unicode_filepath}' is a reserved name",
+                reusable_name=False,
+                reserved_name=unicode_filepath,
+                platform=self.platform,
+            )
+
+
+@lru_cache(maxsize=64)
+def _get_filepath_validator(
+    platform: Platform,
+    min_len: int,
+    max_len: int,
+    fs_encoding: Optional[str],
+    check_reserved: bool,
+    additional_reserved_names: Optional[Tuple[str, ...]],
+) -> FilePathValidator:
+    return FilePathValidator(
+        platform=platform,
+        min_len=min_len,
+        max_len=max_len,
+        fs_encoding=fs_encoding,
+        check_reserved=check_reserved,
+        additional_reserved_names=additional_reserved_names,
+    )
+
+
+def _make_filepath_sanitizer(
+    platform: Platform,
+    max_len: int,
+    fs_encoding: Optional[str],
+    normalize: bool,
+    null_value_handler: Optional[ValidationErrorHandler],
+    reserved_name_handler: Optional[ValidationErrorHandler],
+    additional_reserved_names: Optional[Tuple[str, ...]],
+    validate_after_sanitize: bool,
+) -> FilePathSanitizer:
+    return FilePathSanitizer(
+        platform=platform,
+        max_len=max_len,
+        fs_encoding=fs_encoding,
+        normalize=normalize,
+        null_value_handler=null_value_handler,
+        reserved_name_handler=reserved_name_handler,
+        additional_reserved_names=additional_reserved_names,
+        validate_after_sanitize=validate_after_sanitize,
+    )
+
+
+_get_cached_filepath_sanitizer = lru_cache(maxsize=64)(_make_filepath_sanitizer)
+
+
+def _get_filepath_sanitizer(
+    platform: Platform,
+    max_len: int,
+    fs_encoding: Optional[str],
+    normalize: bool,
+    null_value_handler: Optional[ValidationErrorHandler],
+    reserved_name_handler: Optional[ValidationErrorHandler],
+    additional_reserved_names: Optional[Tuple[str, ...]],
+    validate_after_sanitize: bool,
+) -> FilePathSanitizer:
+    args = (
+        platform,
+        max_len,
+        fs_encoding,
+        normalize,
+        null_value_handler,
+        reserved_name_handler,
+        additional_reserved_names,
+        validate_after_sanitize,
+    )
+    if is_hashable(null_value_handler) and is_hashable(reserved_name_handler):
+        return _get_cached_filepath_sanitizer(*args)
+
+    # an unhashable handler (e.g. a dataclass instance with __call__) cannot be a cache key
+    return _make_filepath_sanitizer(*args)
 
 
 def validate_filepath(
@@ -361,13 +631,13 @@ def validate_filepath(
         <https://docs.microsoft.com/en-us/windows/win32/fileio/naming-a-file>`__
     """
 
-    FilePathValidator(
-        platform=platform,
-        min_len=min_len,
-        max_len=-1 if max_len is None else max_len,
-        fs_encoding=fs_encoding,
-        check_reserved=check_reserved,
-        additional_reserved_names=additional_reserved_names,
+    _get_filepath_validator(
+        normalize_platform(platform),
+        min_len,
+        -1 if max_len is None else max_len,
+        fs_encoding,
+        check_reserved,
+        to_names_key(additional_reserved_names),
     ).validate(file_path)
 
 
@@ -395,13 +665,13 @@ def is_valid_filepath(
         :py:func:`.validate_filepath()`
     """
 
-    return FilePathValidator(
-        platform=platform,
-        min_len=min_len,
-        max_len=-1 if max_len is None else max_len,
-        fs_encoding=fs_encoding,
-        check_reserved=check_reserved,
-        additional_reserved_names=additional_reserved_names,
+    return _get_filepath_validator(
+        normalize_platform(platform),
+        min_len,
+        -1 if max_len is None else max_len,
+        fs_encoding,
+        check_reserved,
+        to_names_key(additional_reserved_names),
     ).is_valid(file_path)
 
 
@@ -504,13 +774,111 @@ def sanitize_filepath(
         if check_reserved is False:
             reserved_name_handler = ReservedNameHandler.as_is
 
-    return FilePathSanitizer(
-        platform=platform,
-        max_len=-1 if max_len is None else max_len,
-        fs_encoding=fs_encoding,
-        normalize=normalize,
-        null_value_handler=null_value_handler,
-        reserved_name_handler=reserved_name_handler,
-        additional_reserved_names=additional_reserved_names,
-        validate_after_sanitize=validate_after_sanitize,
+    return _get_filepath_sanitizer(
+        normalize_platform(platform),
+        -1 if max_len is None else max_len,
+        fs_encoding,
+        normalize,
+        null_value_handler,
+        reserved_name_handler,
+        to_names_key(additional_reserved_names),
+        validate_after_sanitize,
     ).sanitize(file_path, replacement_text)
+
+
+def validate_filepaths(
+    file_paths: Iterable[PathType],
+    platform: Optional[PlatformType] = None,
+    min_len: int = DEFAULT_MIN_LEN,
+    max_len: Optional[int] = None,
+    fs_encoding: Optional[str] = None,
+    check_reserved: bool = True,
+    additional_reserved_names: Optional[Sequence[str]] = None,
+) -> Iterator[Optional[Union[ValidationError, TypeError]]]:
+    """Verifying whether each of the ``file_paths`` is a valid file path or not.
+
+    A single validator is shared by all of the file paths,
+    which is faster than calling :py:func:`.validate_filepath()` for each of them.
+
+    Args:
+        file_paths:
+            File paths to be validated.
+
+    The other arguments are the same as :py:func:`.validate_filepath()`.
+
+    Returns:
+        Iterator of |None| for a valid file path, or the raised ``ValidationError``
+        (``TypeError`` for a value that is not a path) for an invalid one,
+        in the same order as ``file_paths``.
+
+    See Also:
+        :py:func:`.validate_filepath()`
+    """
+
+    validator = _get_filepath_validator(
+        normalize_platform(platform),
+        min_len,
+        -1 if max_len is None else max_len,
+        fs_encoding,
+        check_reserved,
+        to_names_key(additional_reserved_names),
+    )
+
+    return _iter_validation_errors(validator, file_paths)
+
+
+def _iter_validation_errors(
+    validator: FilePathValidator, file_paths: Iterable[PathType]
+) -> Iterator[Optional[Union[ValidationError, TypeError]]]:
+    validate = validator.validate
+    for file_path in file_paths:
+        try:
+            validate(file_path)
+        except (TypeError, ValidationError) as e:
+            yield e
+        else:
+            yield None
+
+
+def sanitize_filepaths(
+    file_paths: Iterable[PathType],
+    replacement_text: str = "",
+    platform: Optional[PlatformType] = None,
+    max_len: Optional[int] = None,
+    fs_encoding: Optional[str] = None,
+    null_value_handler: Optional[ValidationErrorHandler] = None,
+    reserved_name_handler: Optional[ValidationErrorHandler] = None,
+    additional_reserved_names: Optional[Sequence[str]] = None,
+    normalize: bool = True,
+    validate_after_sanitize: bool = False,
+) -> Iterator[PathType]:
+    """Make valid file paths from multiple strings.
+
+    A single sanitizer is shared by all of the file paths,
+    which is faster than calling :py:func:`.sanitize_filepath()` for each of them.
+
+    Args:
+        file_paths:
+            File paths to sanitize.
+
+    The other arguments are the same as :py:func:`.sanitize_filepath()`.
+
+    Returns:
+        Iterator of the sanitized file paths, in the same order as ``file_paths``.
+
+    See Also:
+        :py:func:`.sanitize_filepath()`
+    """
+
+    sanitize = _get_filepath_sanitizer(
+        normalize_platform(platform),
+        -1 if max_len is None else max_len,
+        fs_encoding,
+        normalize,
+        null_value_handler,
+        reserved_name_handler,
+        to_names_key(additional_reserved_names),
+        validate_after_sanitize,
+    ).sanitize
+
+    return (sanitize(file_path, replacement_text) for file_path in file_paths)
@@ -23,8 +23,9 @@ def validate_ltsv_label(label: str) -> None:
 
     validate_pathtype(label, allow_whitespaces=False)
 
-    match_list = __RE_INVALID_LTSV_LABEL.findall(to_str(label))
-    if match_list:
+    label = to_str(label)
+    if __RE_INVALID_LTSV_LABEL.search(label) is not None:
+        match_list = __RE_INVALID_LTSV_LABEL.findall(label)
         raise InvalidCharError(f"invalid character found for a LTSV format label: {match_list}")
 
 
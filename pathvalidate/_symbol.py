@@ -5,12 +5,12 @@
 import re
 from typing import Sequence
 
-from ._common import ascii_symbols, to_str, unprintable_ascii_chars
+from ._common import ascii_symbols, to_char_class, to_str, unprintable_ascii_chars
 from .error import InvalidCharError
 
 
 __RE_SYMBOL = re.compile(
-    "[{}]".format(re.escape("".join(ascii_symbols + unprintable_ascii_chars))), re.UNICODE
+    to_char_class("".join(ascii_symbols + unprintable_ascii_chars)), re.UNICODE
 )
 
 
@@ -27,8 +27,9 @@ def validate_symbol(text: str) -> None:
             If symbol(s) included in the ``text``.
     """
 
-    match_list = __RE_SYMBOL.findall(to_str(text))
-    if match_list:
+    text = to_str(text)
+    if __RE_SYMBOL.search(text) is not None:
+        match_list = __RE_SYMBOL.findall(text)
         raise InvalidCharError(f"invalid symbols found: {match_list}")
 
 
@@ -4,6 +4,7 @@
 
 import random
 import string
+from dataclasses import dataclass
 from itertools import product
 
 
@@ -115,3 +116,13 @@ def is_faker_installed():
 
 def randstr(length, char_list=alphanum_chars):
     return "".join([random.choice(char_list) for _i in range(length)])
+
+
+@dataclass
+class UnhashableSuffixHandler:
+    """A callable handler that is not hashable: dataclasses set ``__hash__`` to None."""
+
+    suffix: str
+
+    def __call__(self, e):
+        return f"{e.reserved_name or ''}{self.suffix}"
@@ -3,6 +3,7 @@
 """
 
 import itertools
+import re
 
 import pytest
 from tcolorpy import tcolor
@@ -13,6 +14,7 @@ from pathvalidate import (
     replace_unprintable_char,
     unprintable_ascii_chars,
 )
+from pathvalidate._common import to_char_class
 
 from ._common import alphanum_chars
 
@@ -57,3 +59,38 @@ class Test_replace_ansi_escape:
         value = "test"
         ansi_value = tcolor(value, color="ffffff", bg_color="111111", styles=["bold"])
         assert replace_ansi_escape(ansi_value) == value
+
+
+class Test_to_char_class:
+    @pytest.mark.parametrize(
+        ["value", "expected"],
+        [
+            ["a", "[a]"],
+            ["ab", "[ab]"],
+            ["cab", "[a-c]"],
+            ["\x00\x01\x02\x7f", "[\\x00-\\x02\\x7f]"],
+            ["-^]\\", "[\\-\\\\-\\^]"],
+            ["\U000E0001", "[\\U000e0001]"],
+        ],
+    )
+    def test_normal(self, value, expected):
+        assert to_char_class(value) == expected
+
+    def test_normal_match_non_bmp(self):
+        regexp = re.compile(to_char_class("\U000E0001"))
+
+        assert regexp.search("\U000E0001") is not None
+        assert regexp.search("1") is None
+
+    @pytest.mark.parametrize(
+        ["value"],
+        [
+            ["".join(unprintable_ascii_chars)],
+            ["".join(ascii_symbols)],
+            ["".join(ascii_symbols + unprintable_ascii_chars)],
+        ],
+    )
+    def test_normal_match(self, value):
+        regexp = re.compile(to_char_class(value))
+        for i in range(256):
+            assert (regexp.search(chr(i)) is not None) == (chr(i) in value)
@@ -33,6 +33,7 @@ from ._common import (
     VALID_FILENAME_CHARS,
     VALID_PLATFORM_NAMES,
     WIN_RESERVED_FILE_NAMES,
+    UnhashableSuffixHandler,
     is_faker_installed,
     randstr,
 )
@@ -73,6 +74,23 @@ class Test_FileSanitizer:
         sanitizer = FileNameSanitizer(additional_reserved_names=["abc"])
         assert sanitizer.reserved_keywords == ("ABC",)
 
+    @pytest.mark.parametrize(
+        ["test_platform", "replace_text"],
+        [
+            ["windows", ""],
+            ["windows", "_"],
+            ["linux", ""],
+            ["universal", "_"],
+        ],
+    )
+    def test_normal_sanitize_components(self, test_platform, replace_text):
+        entries = ["abc", "a*b", "COM1.txt", "abc. ", "", "  ", "a" * 300]
+        sanitizer = FileNameSanitizer(255, platform=test_platform)
+
+        assert sanitizer.sanitize_components(entries, replace_text) == [
+            sanitizer.sanitize(entry, replace_text) for entry in entries
+        ]
+
 
 class Test_FileNameValidator:
     @pytest.mark.parametrize(
@@ -576,6 +594,15 @@ class Test_sanitize_filename:
         with pytest.raises(ValidationError):
             sanitize_filename(value, null_value_handler=raise_error)
 
+    def test_normal_unhashable_handler(self):
+        assert sanitize_filename("", null_value_handler=UnhashableSuffixHandler("-x")) == "-x"
+        assert (
+            sanitize_filename(
+                "CON", platform="windows", reserved_name_handler=UnhashableSuffixHandler("-x")
+            )
+            == "CON-x"
+        )
+
     @pytest.mark.parametrize(
         ["value", "replace_text", "expected"],
         [
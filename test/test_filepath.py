@@ -18,7 +18,9 @@ from pathvalidate import (
     ValidationError,
     is_valid_filepath,
     sanitize_filepath,
+    sanitize_filepaths,
     validate_filepath,
+    validate_filepaths,
 )
 from pathvalidate._common import unprintable_ascii_chars
 from pathvalidate._filepath import FilePathSanitizer, FilePathValidator
@@ -30,6 +32,7 @@ from ._common import (
     NTFS_RESERVED_FILE_NAMES,
     VALID_PATH_CHARS,
     WIN_RESERVED_FILE_NAMES,
+    UnhashableSuffixHandler,
     is_faker_installed,
     randstr,
 )
@@ -296,6 +299,20 @@ class Test_validate_filepath:
         with pytest.raises(expected):
             validate_filepath(value, platform=test_platform)
 
+    @pytest.mark.parametrize(
+        ["value", "expected"],
+        [
+            ["/a/b/c.txt", "POSIX style"],
+            ["C:\\a\\b\\c.txt", "NT style"],
+            ["\\\\server\\share\\c.txt", "NT style"],
+        ],
+    )
+    def test_abs_path_universal(self, value, expected):
+        with pytest.raises(ValidationError) as e:
+            validate_filepath(value, platform="universal")
+        assert e.value.reason == ErrorReason.MALFORMED_ABS_PATH
+        assert expected in e.value.description
+
     @pytest.mark.skipif(m_platform.system() != "Windows", reason="platform dependent tests")
     @pytest.mark.parametrize(
         ["value", "expected"],
@@ -393,6 +410,24 @@ class Test_validate_filepath:
         assert e.value.reason == ErrorReason.INVALID_CHARACTER
         assert not is_valid_filepath(value)
 
+    @pytest.mark.parametrize(
+        ["value", "platform", "fs_encoding"],
+        [
+            ["あいう/{}えお.txt".format(invalid_c), platform, fs_encoding]
+            for invalid_c, platform, fs_encoding in product(
+                ["\0", "\x1f", "\x7f", "*", "|"],
+                ["linux", "windows"],
+                ["utf-8", "shift_jis", "utf-16"],
+            )
+            if platform == "windows" or invalid_c in INVALID_PATH_CHARS
+        ],
+    )
+    def test_exception_invalid_char_multibyte(self, value, platform, fs_encoding):
+        with pytest.raises(ValidationError) as e:
+            validate_filepath(value, platform=platform, fs_encoding=fs_encoding)
+        assert e.value.reason == ErrorReason.INVALID_CHARACTER
+        assert not is_valid_filepath(value, platform=platform, fs_encoding=fs_encoding)
+
     @pytest.mark.parametrize(
         ["value", "platform"],
         [
@@ -461,6 +496,12 @@ class Test_validate_filepath:
             for drive, platform, filename in product(
                 ["C:", "D:"], ["windows"], NTFS_RESERVED_FILE_NAMES
             )
+        ]
+        + [
+            [f"{drive}\\{filename.lower()}", platform, ValidationError]
+            for drive, platform, filename in product(
+                ["C:", "D:"], ["windows"], NTFS_RESERVED_FILE_NAMES
+            )
         ],
     )
     def test_exception_reserved_name(self, value, platform, expected):
@@ -516,6 +557,48 @@ class Test_validate_filepath:
         assert not is_valid_filepath(value)
 
 
+class Test_validate_filepaths:
+    @pytest.mark.parametrize(
+        ["platform", "values", "expected"],
+        [
+            ["linux", [], []],
+            ["linux", ["a/b/c.txt", "/a/b", "a\0b"], [None, None, ErrorReason.INVALID_CHARACTER]],
+            [
+                "windows",
+                ["a\\b", "a*b", "CON", Path("a/b")],
+                [None, ErrorReason.INVALID_CHARACTER, ErrorReason.RESERVED_NAME, None],
+            ],
+            ["universal", ["", "a/b"], [ErrorReason.NULL_NAME, None]],
+        ],
+    )
+    def test_normal(self, platform, values, expected):
+        results = list(validate_filepaths(values, platform=platform))
+
+        assert [None if e is None else e.reason for e in results] == expected
+        assert [e is None for e in results] == [
+            is_valid_filepath(value, platform=platform) for value in values
+        ]
+
+    def test_normal_lazy(self):
+        results = validate_filepaths(iter(["a", "a\0b"]), platform="linux")
+
+        assert next(results) is None
+        assert next(results).reason == ErrorReason.INVALID_CHARACTER
+        with pytest.raises(StopIteration):
+            next(results)
+
+    def test_normal_type_error(self):
+        values = ["a", 123, "b"]
+        results = list(validate_filepaths(values, platform="linux"))
+
+        assert results[0] is None
+        assert isinstance(results[1], TypeError)
+        assert results[2] is None
+        assert [e is None for e in results] == [
+            is_valid_filepath(value, platform="linux") for value in values
+        ]
+
+
 class Test_validate_win_file_path:
     VALID_CHARS = VALID_PATH_CHARS
 
@@ -665,6 +748,17 @@ class Test_sanitize_filepath:
             for drive, platform, filename in product(
                 ["C:", "D:"], ["windows"], NTFS_RESERVED_FILE_NAMES
             )
+        ]
+        + [
+            [f"{drive}\\{filename.lower()}", platform, f"{drive}\\{filename.lower()}_"]
+            for drive, platform, filename in product(
+                ["C:", "D:"], ["windows"], NTFS_RESERVED_FILE_NAMES
+            )
+        ]
+        + [
+            ["abc\\con.txt", "windows", "abc\\con_.txt"],
+            ["abc\\Con.TXT", "windows", "abc\\Con_.TXT"],
+            ["abc/cOn.txt", "universal", "abc/cOn_.txt"],
         ],
     )
     def test_normal_reserved_name(self, value, test_platform, expected):
@@ -800,6 +894,46 @@ class Test_sanitize_filepath:
         with pytest.raises(ValidationError):
             sanitize_filepath(value, null_value_handler=raise_error)
 
+    @pytest.mark.parametrize(
+        ["platform", "value", "expected"],
+        [
+            ["linux", "/a/b", "/a/b"],
+            ["linux", "/a/b\0", "/a/b"],
+            ["windows", "C:\\a\\b", "C:\\a\\b"],
+            ["windows", "C:\\a\\b*", "C:\\a\\b"],
+        ],
+    )
+    def test_normal_null_value_handler_abspath(self, platform, value, expected):
+        for null_value_handler in (raise_error, NullValueHandler.return_timestamp):
+            assert (
+                sanitize_filepath(value, platform=platform, null_value_handler=null_value_handler)
+                == expected
+            )
+
+    def test_normal_unhashable_handler(self):
+        handler = UnhashableSuffixHandler("-x")
+
+        assert (
+            sanitize_filepath("a/CON", platform="windows", reserved_name_handler=handler)
+            == "a\\CON-x"
+        )
+        assert list(
+            sanitize_filepaths(["a/CON"], platform="windows", reserved_name_handler=handler)
+        ) == ["a\\CON-x"]
+
+    @pytest.mark.parametrize(
+        ["value", "max_len", "fs_encoding", "expected"],
+        [
+            ["abcdefghijk\u200b", 10, "latin-1", "abcdefghij"],
+            ["bar.txtCé" + "x" * 30, 5, "ascii", "bar.t"],
+        ],
+    )
+    def test_normal_truncate_unencodable(self, value, max_len, fs_encoding, expected):
+        assert (
+            sanitize_filepath(value, platform="linux", max_len=max_len, fs_encoding=fs_encoding)
+            == expected
+        )
+
     @pytest.mark.parametrize(
         ["test_platform", "value", "replace_text", "expected"],
         [
@@ -829,6 +963,19 @@ class Test_sanitize_filepath:
             ["universal", "a//b", "a/b"],
             ["universal", "a\\b", "a/b"],
             ["universal", "a\\\\b", "a/b"],
+            ["windows", "C:a", "C:a"],
+            ["windows", "C:", "C:"],
+            ["windows", "C:\\a\\", "C:\\a"],
+            ["windows", "C:\\", "C:\\"],
+            ["windows", "C:/", "C:\\"],
+            ["windows", "C:\\a?\\b", "C:\\a\\b"],
+            ["windows", "\\\\server\\share\\a?b", "\\\\server\\share\\ab"],
+            ["windows", "//server/share/a?b", "\\\\server\\share\\ab"],
+            ["windows", "//server/share/", "\\\\server\\share"],
+            ["linux", "/abs/path", "/abs/path"],
+            ["windows", "a\\b.", "a\\b"],
+            ["linux", "/a/b", "/a/b"],
+            ["linux", "a/b/", "a/b"],
         ],
     )
     def test_normal_path_separator(self, platform, value, expected):
@@ -903,3 +1050,19 @@ class Test_sanitize_filepath:
         with pytest.raises(expected):
             sanitize_filepath(value)
         assert not is_valid_filepath(value)
+
+
+class Test_sanitize_filepaths:
+    @pytest.mark.parametrize(
+        ["platform", "values", "replace_text"],
+        [
+            ["linux", [], ""],
+            ["linux", ["a/b/c.txt", "a\0b", "a//b/../c"], "_"],
+            ["windows", ["a\\b", "a*b", "CON", "C:\\$Mft", Path("a/b?")], ""],
+            ["universal", ["", "a/b", "a:b"], "_"],
+        ],
+    )
+    def test_normal(self, platform, values, replace_text):
+        assert list(sanitize_filepaths(values, replace_text, platform=platform)) == [
+            sanitize_filepath(value, replace_text, platform=platform) for value in values
+        ]